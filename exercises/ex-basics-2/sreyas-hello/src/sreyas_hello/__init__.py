@@ -1,14 +1,21 @@
 import sys
-from rich.console import Console
+
+USAGE = "usage: sreyas-hello [NAME]\n\nSay hello to NAME (or world) in a few rich styles.\n"
 
 def main() -> None:
-    console = Console()
-    
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        sys.stdout.write(USAGE)
+        return
+
     who = sys.argv[1] if len(sys.argv) > 1 else "world"
-    
+
+    # rich pulls in a lot at import time, so only load it once we know we're printing
+    from rich.console import Console
+    console = Console()
+
     console.print(f"Hello, [bold red]{who}[/bold red]")
     console.print(f"Hello, {who}", style='underline blue')
-    console.print("Hello [blue]Alice[/blue]") 
+    console.print("Hello [blue]Alice[/blue]")
     console.print("Hello [bold green]Alice[/]")      # Bold green ([/] closes all tags)
     console.print("Hello [white on red]Alice[/]")    # White on red background
     console.print("Hello [bold italic cyan]Alice[/]")
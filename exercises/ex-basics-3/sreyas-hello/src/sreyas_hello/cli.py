@@ -1,20 +1,48 @@
-import typer
-from .hello import say_hello
+import sys
 
-# Force app as a group by preventing direct execution
-app = typer.Typer(
-    help="Say hello in different ways.",
-    no_args_is_help=True  # This forces subcommand structure
-)
 
-@app.command("hello")
-def hello(name: str = "World"):
-    """Say hello to someone (or World)."""
-    msg = say_hello(name)
-    print(f"Hello {msg}")
+def _build_app():
+    import typer
+    from .hello import say_hello
+
+    # Force app as a group by preventing direct execution
+    app = typer.Typer(
+        help="Say hello in different ways.",
+        no_args_is_help=True  # This forces subcommand structure
+    )
+
+    @app.command("hello")
+    def hello(name: str = "World"):
+        """Say hello to someone (or World)."""
+        msg = say_hello(name)
+        print(f"Hello {msg}")
+
+    return app
+
+
+def _sniff_name(args: list[str]) -> str | None:
+    """
+    Return the name for the plain `[--name NAME]` forms, else None.
+    Typer collapses a single-command app, so `hello` is the root command.
+    """
+    if not args:
+        return "World"
+    if len(args) == 2 and args[0] == "--name" and not args[1].startswith("-"):
+        return args[1]
+    if len(args) == 1 and args[0].startswith("--name="):
+        return args[0].split("=", 1)[1]
+    return None
+
 
 def cli():
-    app()
+    # Skip importing typer for the common case, it dominates the runtime
+    name = _sniff_name(sys.argv[1:])
+    if name is not None:
+        from .hello import say_hello
+        print(f"Hello {say_hello(name)}")
+        return
+
+    _build_app()()
 
 if __name__ == "__main__":
     cli()
@@ -1,55 +1,144 @@
 import sys
 import os
+import re
 import typer
-from typing_extensions import Annotated, Iterator, Optional
-from dotenv import load_dotenv
+from typing_extensions import Annotated, Callable, Iterator, Optional, TextIO
+
+def find_env_file() -> Optional[str]:
+    '''Find the .env load_dotenv() would use: next to this file, else the nearest parent.'''
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, '.env')
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def env_default(key: str, default: str) -> str:
+    '''
+    Look key up in the environment, then in the .env file.
+    Handles the common dotenv forms: `export KEY=value`, quoted values and
+    trailing ` # comments`; the last assignment wins. No variable expansion.
+    '''
+    if key in os.environ:
+        return os.environ[key]
+    path = find_env_file()
+    if path is None:
+        return default
+    found = default
+    with open(path) as file:
+        for raw in file:
+            line = raw.strip()
+            if line.startswith('export '):
+                line = line[len('export '):].lstrip()
+            name, sep, value = line.partition('=')
+            if not sep or name.strip() != key:
+                continue
+            value = value.strip()
+            if value[:1] in ('"', "'") and value[0] in value[1:]:
+                found = value[1:value.index(value[0], 1)]
+            else:
+                found = re.split(r'\s+#', value, maxsplit=1)[0]
+    return found
 
-load_dotenv()
 
 def read_lines(path: str) -> Iterator[str]:
     '''Read lines from a file and yield them without trailing newlines.'''
     
+    # Read ~1MB blocks and split them ourselves instead of one readline per line.
+    # Text mode keeps the universal-newline handling of `for line in file`.
     with open(path, 'r') as file:
-        for line in file:
-            yield line.rstrip('\n')
+        tail = ''
+        while chunk := file.read(1 << 20):
+            lines = (tail + chunk).split('\n')
+            tail = lines.pop()
+            yield from lines
+        if tail:
+            yield tail
+
+
+def to_snakecase(line: str) -> str:
+    return line.replace(' ','_').lower()
+
+
+MODES = {
+    'uppercase': str.upper,
+    'lowercase': str.lower,
+    'snakecase': to_snakecase,
+}
+
+
+def get_transform(mode: str) -> Callable[[str], str]:
+    '''Resolve a mode to its str->str transform once, instead of re-checking it per line.'''
+
+    try:
+        return MODES[mode]
+    except KeyError:
+        raise ValueError(f"Invalid Mode {mode}") from None
 
 
 def transform_line(line: str, mode: str) -> str:
     '''Transform a line of text based on the given mode.'''
 
-    if mode == 'uppercase':
-        return line.upper()
-    elif mode == 'lowercase':
-        return line.lower()
-    elif mode == 'snakecase':
-        return line.replace(' ','_').lower()
-    else:
-        raise ValueError(f"Invalid Mode {mode}")
+    return get_transform(mode)(line)
+
+
+def write_chunked(lines: Iterator[str], file: TextIO, chunk_size: int = 65536) -> None:
+    '''Write lines with one write() per ~chunk_size characters instead of one per line.'''
+    buffer: list[str] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        buffer.append('\n')
+        size += len(line) + 1
+        if size >= chunk_size:
+            file.write(''.join(buffer))
+            buffer.clear()
+            size = 0
+    if buffer:
+        file.write(''.join(buffer))
+
+
+# output_file as given -> absolute path whose directory is known to exist
+RESOLVED_OUTPUTS: dict[str, str] = {}
+
+
+def resolve_output_path(output_file: str) -> str:
+    '''Expand and absolutize output_file, creating its directory only the first time.'''
+    resolved = RESOLVED_OUTPUTS.get(output_file)
+    if resolved is None:
+        resolved = os.path.abspath(os.path.expanduser(output_file))
+        directory = os.path.dirname(resolved)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        RESOLVED_OUTPUTS[output_file] = resolved
+    return resolved
 
 
 def write_output(lines: Iterator[str], output_file: Optional[str]) -> None:
     '''Write lines either to stdout or to a specified file.'''
 
     if output_file == None:
-        for line in lines:
-            print(line)
+        write_chunked(lines, sys.stdout)
     else:
-        output_file = os.path.abspath(os.path.expanduser(output_file))
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        output_file = resolve_output_path(output_file)
 
         with open(os.path.join(output_file), 'w') as file:
-            for line in lines:
-                file.write(line + '\n')
+            write_chunked(lines, file)
 
 
 def main(
         input: Annotated[str, typer.Argument()],
-        mode: Annotated[str, typer.Option(help='Modes can be uppercase, lowercase or snakecase')] = os.getenv('DEFAULT_MODE', 'lowercase'),
+        mode: Annotated[Optional[str], typer.Option(help='Modes can be uppercase, lowercase or snakecase. Defaults to $DEFAULT_MODE, then lowercase.')] = None,
         output: Annotated[str, typer.Option(help='Specify the location of the output file. If not specified, then prints in the console.')] = None):
     '''Transform file contents and print or save results.'''
 
+    mode = mode or env_default('DEFAULT_MODE', 'lowercase')
     lines = read_lines(input)
-    transformed = (transform_line(line, mode) for line in lines)
+    transformed = map(get_transform(mode), lines)
     write_output(transformed, output if output else None)
 
 
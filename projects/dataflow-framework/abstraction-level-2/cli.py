@@ -1,27 +1,75 @@
+import sys
+
+# Answer --version before importing typer and the pipeline stack
+if len(sys.argv) >= 2 and sys.argv[1] in ("-v", "--version"):
+    print("0.1.0")
+    sys.exit(0)
+
 import typer
 import os
+import re
 from typing_extensions import Annotated
-from dotenv import load_dotenv
-from main import run
-
-load_dotenv()
 
 app = typer.Typer()
 
 
+def find_env_file() -> str | None:
+    """Find the .env load_dotenv() would use: next to this file, else the nearest parent."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, ".env")
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def env_default(key: str, default: str) -> str:
+    """
+    Look key up in the environment, then in the .env file.
+    Handles the common dotenv forms: `export KEY=value`, quoted values and
+    trailing ` # comments`; the last assignment wins. No variable expansion.
+    """
+    if key in os.environ:
+        return os.environ[key]
+    path = find_env_file()
+    if path is None:
+        return default
+    found = default
+    with open(path) as file:
+        for raw in file:
+            line = raw.strip()
+            if line.startswith("export "):
+                line = line[len("export "):].lstrip()
+            name, sep, value = line.partition("=")
+            if not sep or name.strip() != key:
+                continue
+            value = value.strip()
+            if value[:1] in ('"', "'") and value[0] in value[1:]:
+                found = value[1:value.index(value[0], 1)]
+            else:
+                found = re.split(r"\s+#", value, maxsplit=1)[0]
+    return found
+
+
 @app.command()
 def main(
     input: Annotated[str, typer.Argument()],
     mode: Annotated[
-        str,
-        typer.Option(help="Modes can be uppercase, lowercase or snakecase"),
-    ] = os.getenv("DEFAULT_MODE", "lowercase"),
+        str | None,
+        typer.Option(help="Modes can be uppercase, lowercase or snakecase. Defaults to $DEFAULT_MODE, then lowercase."),
+    ] = None,
     output: Annotated[
         str,
         typer.Option(help="Specify output file. If not specified, prints to console."),
     ] = None,
 ):
-    run(input, mode, output)
+    # Deferred so --help never reads .env or imports the pipeline
+    from main import run
+
+    run(input, mode or env_default("DEFAULT_MODE", "lowercase"), output)
 
 
 if __name__ == "__main__":
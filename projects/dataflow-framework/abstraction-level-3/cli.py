@@ -1,10 +1,13 @@
+import sys
+
+# Answer --version before importing typer and the pipeline stack
+if len(sys.argv) >= 2 and sys.argv[1] in ("-v", "--version"):
+    print("0.1.0")
+    sys.exit(0)
+
 import typer
 import os
 from typing_extensions import Annotated
-from dotenv import load_dotenv
-from main import run
-
-load_dotenv()
 
 app = typer.Typer()
 
@@ -21,6 +24,9 @@ def main(
         typer.Option(help="Specify output file. If not specified, prints to console."),
     ] = None,
 ):
+    # Deferred so --help never imports the pipeline
+    from main import run
+
     run(input, config, output)
 
 
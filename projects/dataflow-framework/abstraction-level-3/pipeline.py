@@ -1,25 +1,45 @@
+import os
 import yaml
+import functools
 import importlib
 from typing import Any
 from typez import ProcessorFn
 
-def load_function(import_path: str) -> ProcessorFn:
-    """Dynamically import a function from a dotted path like 'processors.upper.to_uppercase'."""
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+@functools.lru_cache(maxsize=32)
+def parse_config(config_path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+def read_config(config_path: str) -> dict[str, Any]:
+    """Parse a YAML config, reusing the cached parse while the file's mtime is unchanged."""
+    return parse_config(config_path, os.stat(config_path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=None)
+def resolve(import_path: str) -> Any:
+    """Import and return the object at a dotted path, cached per path."""
     try:
         module_path, func_name = import_path.rsplit(".", 1)
         module = importlib.import_module(module_path)
-        fn = getattr(module, func_name)
+        return getattr(module, func_name)
     except (ValueError, ImportError, AttributeError) as e:
         raise ImportError(f"Could not import processor '{import_path}': {e}") from e
 
+def load_function(import_path: str) -> ProcessorFn:
+    """Dynamically import a function from a dotted path like 'processors.upper.to_uppercase'."""
+    fn = resolve(import_path)
+
     if not callable(fn):
         raise TypeError(f"Processor '{import_path}' is not callable")
     return fn
 
 def get_pipeline(config_path: str) -> list[ProcessorFn]:
     """Load pipeline steps from YAML config file."""
-    with open(config_path, "r") as f:
-        config: dict[str, Any] = yaml.safe_load(f)
+    config = read_config(config_path)
 
     steps = config.get("pipeline", [])
     if not isinstance(steps, list):
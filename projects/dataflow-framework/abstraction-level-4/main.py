@@ -1,12 +1,49 @@
 import os
-from typing import Iterator, Optional
+import sys
+from typing import Iterator, Optional, TextIO
 from pipeline import get_pipeline
 
 def read_lines(path: str) -> Iterator[str]:
     """Lazily read lines from a file, stripping newlines."""
+    # Read ~1MB blocks and split them ourselves instead of one readline per line.
+    # Text mode keeps the universal-newline handling of `for line in file`.
     with open(path, "r") as file:
-        for line in file:
-            yield line.rstrip("\n")
+        tail = ""
+        while chunk := file.read(1 << 20):
+            lines = (tail + chunk).split("\n")
+            tail = lines.pop()
+            yield from lines
+        if tail:
+            yield tail
+
+def write_chunked(lines: Iterator[str], file: TextIO, chunk_size: int = 65536) -> None:
+    """Write lines with one write() per ~chunk_size characters instead of one per line."""
+    buffer: list[str] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        buffer.append("\n")
+        size += len(line) + 1
+        if size >= chunk_size:
+            file.write("".join(buffer))
+            buffer.clear()
+            size = 0
+    if buffer:
+        file.write("".join(buffer))
+
+# output_file as given -> absolute path whose directory is known to exist
+RESOLVED_OUTPUTS: dict[str, str] = {}
+
+def resolve_output_path(output_file: str) -> str:
+    """Expand and absolutize output_file, creating its directory only the first time."""
+    resolved = RESOLVED_OUTPUTS.get(output_file)
+    if resolved is None:
+        resolved = os.path.abspath(os.path.expanduser(output_file))
+        directory = os.path.dirname(resolved)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        RESOLVED_OUTPUTS[output_file] = resolved
+    return resolved
 
 def write_output(lines: Iterator[str], output_file: Optional[str]) -> None:
     """
@@ -15,14 +52,11 @@ def write_output(lines: Iterator[str], output_file: Optional[str]) -> None:
         write_output(iter(["a", "b"]), "out.txt")  # writes to file
     """
     if output_file is None:
-        for line in lines:
-            print(line)
+        write_chunked(lines, sys.stdout)
     else:
-        output_file = os.path.abspath(os.path.expanduser(output_file))
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        output_file = resolve_output_path(output_file)
         with open(output_file, "w") as file:
-            for line in lines:
-                file.write(line + "\n")
+            write_chunked(lines, file)
 
 def run(input_path: str, config_path: str, output_path: Optional[str]) -> None:
     """
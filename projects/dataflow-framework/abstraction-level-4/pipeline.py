@@ -1,22 +1,43 @@
+import os
 import yaml
+import functools
 import importlib
 from typing import Any, Iterator
 from processors.base import ProcessorFn
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+@functools.lru_cache(maxsize=32)
+def parse_config(config_path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+def read_config(config_path: str) -> dict[str, Any]:
+    """Parse a YAML config, reusing the cached parse while the file's mtime is unchanged."""
+    return parse_config(config_path, os.stat(config_path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=None)
+def resolve(import_path: str) -> Any:
+    """Import and return the object at a dotted path, cached per path."""
+    try:
+        module_path, name = import_path.rsplit(".", 1)
+        module = importlib.import_module(module_path)
+        return getattr(module, name)
+    except (ValueError, ImportError, AttributeError) as e:
+        raise ImportError(f"Could not import processor '{import_path}': {e}") from e
+
 def load_function(import_path: str) -> ProcessorFn:
     """
     Dynamically import a processor from a dotted path like:
     - 'processors.upper.upper_processor' (streamified function)
     - 'processors.base.LineCounter' (stateful class)
     """
-    try:
-        module_path, name = import_path.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        obj = getattr(module, name)
-    except (ValueError, ImportError, AttributeError) as e:
-        raise ImportError(f"Could not import processor '{import_path}': {e}") from e
+    obj = resolve(import_path)
 
-    # If it's a class, instantiate it
+    # If it's a class, instantiate it (never cached, so every pipeline gets fresh state)
     if isinstance(obj, type):
         obj = obj()
     # Ensure it's callable
@@ -28,8 +49,7 @@ def get_pipeline(config_path: str) -> list[ProcessorFn]:
     """
     Load a list of processors from a YAML config file. Each processor must be callable: Iterator[str] -> Iterator[str]
     """
-    with open(config_path, "r") as f:
-        config: dict[str, Any] = yaml.safe_load(f)
+    config = read_config(config_path)
 
     steps = config.get("pipeline", [])
     if not isinstance(steps, list):
@@ -7,8 +7,8 @@ def streamify(fn: Callable[[str], str]) -> ProcessorFn:
     Wrap a simple str->str function to work on a stream of lines.
     """
     def wrapper(lines: Iterator[str]) -> Iterator[str]:
-        for line in lines:
-            yield fn(line)
+        # map drives the per-line calls from C instead of a Python generator frame
+        return map(fn, lines)
     return wrapper
 
 class LineCounter:
@@ -16,6 +16,8 @@ class LineCounter:
     Stateful processor that counts lines seen and emits a tuple:
     "<line_number>: <line>"
     """
+    __slots__ = ("count",)
+
     def __init__(self):
         self.count = 0
 
@@ -13,11 +13,15 @@ class JoinEveryTwoLines:
         self.sep = sep
 
     def __call__(self, lines: Iterator[str]) -> Iterator[str]:
-        buffer = []
+        # One window allocated per call and reused through a cursor
+        n, sep = self.n, self.sep
+        buffer: list[str | None] = [None] * n
+        i = 0
         for line in lines:
-            buffer.append(line)
-            if len(buffer) == self.n:
-                yield self.sep.join(buffer)
-                buffer = []
-        if buffer:
-            yield self.sep.join(buffer)
+            buffer[i] = line
+            i += 1
+            if i == n:
+                yield sep.join(buffer)
+                i = 0
+        if i:
+            yield sep.join(buffer[:i])
@@ -1,14 +1,9 @@
-from typing import Iterator, Tuple, List
+from processors import snake
+from processors.base import streamify
 from typez import ProcessorFn
 
-def to_uppercase(lines: Iterator[str]) -> Iterator[Tuple[List[str], str]]:
-    for line in lines:
-        yield (["uppercase"], line.upper())
-
-def to_snakecase(lines: Iterator[str]) -> Iterator[Tuple[List[str], str]]:
-    for line in lines:
-        yield (["snake"], line.replace(" ", "_").lower())
-
-def trim(lines: Iterator[str]) -> Iterator[Tuple[List[str], str]]:
-    for line in lines:
-        yield (["trimmed"], line.strip())
+# Built with streamify so the DAG builder can fuse them into neighbouring
+# str->str stages, and so calling them directly behaves the same way
+to_uppercase: ProcessorFn = streamify(str.upper, tag="uppercase")
+to_snakecase: ProcessorFn = streamify(snake.to_snakecase, tag="snake")
+trim: ProcessorFn = streamify(str.strip, tag="trimmed")
@@ -1,19 +1,31 @@
-from typing import Iterator, Callable, Tuple, List
+import sys
+from typing import Iterator, Callable, Tuple
 
-ProcessorFn = Callable[[Iterator[str]], Iterator[Tuple[List[str], str]]]
+ProcessorFn = Callable[[Iterator[str]], Iterator[Tuple[Tuple[str, ...], str]]]
 
 def streamify(fn: Callable[[str], str], tag: str = "default") -> ProcessorFn:
-    def wrapper(lines: Iterator[str]) -> Iterator[Tuple[List[str], str]]:
-        for line in lines:
-            yield [tag], fn(line)
+    tag = sys.intern(tag)
+    tags = (tag,)  # shared by every emitted line instead of a fresh list each time
+
+    def wrapper(lines: Iterator[str]) -> Iterator[Tuple[Tuple[str, ...], str]]:
+        # map runs the str->str calls from C; only the tagging stays in Python
+        for out in map(fn, lines):
+            yield tags, out
+    # Exposed so the DAG builder can fuse chains of streamified nodes
+    wrapper.inner_fn = fn
+    wrapper.tag = tag
     return wrapper
 
 class LineCounter:
+    __slots__ = ("count", "tag", "tags")
+
     def __init__(self, tag: str = "default"):
         self.count = 0
         self.tag = tag
+        self.tags = (sys.intern(tag),)
 
-    def __call__(self, lines: Iterator[str]) -> Iterator[Tuple[List[str], str]]:
+    def __call__(self, lines: Iterator[str]) -> Iterator[Tuple[Tuple[str, ...], str]]:
+        tags = self.tags
         for line in lines:
             self.count += 1
-            yield [self.tag], f"{self.count}: {line}"
+            yield tags, f"{self.count}: {line}"
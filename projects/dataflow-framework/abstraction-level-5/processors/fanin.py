@@ -1,17 +1,23 @@
-from typing import Iterator, Tuple, List
+import sys
+from typing import Iterator, Tuple
 
 class JoinEveryTwoLines:
     def __init__(self, n: int = 2, sep: str = " ", tag: str = "joined"):
         self.n = n
         self.sep = sep
         self.tag = tag
+        self.tags = (sys.intern(tag),)
 
-    def __call__(self, lines: Iterator[str]) -> Iterator[Tuple[List[str], str]]:
-        buffer = []
+    def __call__(self, lines: Iterator[str]) -> Iterator[Tuple[Tuple[str, ...], str]]:
+        # One window allocated per call and reused through a cursor
+        n, sep, tags = self.n, self.sep, self.tags
+        buffer: list[str | None] = [None] * n
+        i = 0
         for line in lines:
-            buffer.append(line)
-            if len(buffer) == self.n:
-                yield [self.tag], self.sep.join(buffer)
-                buffer = []
-        if buffer:
-            yield [self.tag], self.sep.join(buffer)
+            buffer[i] = line
+            i += 1
+            if i == n:
+                yield tags, sep.join(buffer)
+                i = 0
+        if i:
+            yield tags, sep.join(buffer[:i])
@@ -1,11 +1,16 @@
-from typing import Iterator, Tuple, List
+import sys
+from itertools import repeat
+from typing import Iterator, Tuple
 
 class SplitLines:
     def __init__(self, delimiter: str = ",", tag: str = "split"):
         self.delimiter = delimiter
         self.tag = tag
+        self.tags = (sys.intern(tag),)
 
-    def __call__(self, lines: Iterator[str]) -> Iterator[Tuple[List[str], str]]:
+    def __call__(self, lines: Iterator[str]) -> Iterator[Tuple[Tuple[str, ...], str]]:
+        delimiter, tags = self.delimiter, self.tags
+        # zip/map build every (tags, field) pair of a line in C; tags is an
+        # immutable shared tuple, so repeat() can hand out the same object
         for line in lines:
-            for part in line.split(self.delimiter):
-                yield [self.tag], part.strip()
+            yield from zip(repeat(tags), map(str.strip, line.split(delimiter)))
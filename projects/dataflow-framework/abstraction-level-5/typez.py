@@ -1,4 +1,4 @@
-from typing import Iterator, Tuple, List, Callable
+from typing import Iterator, Tuple, Callable
 
 # Each processor takes an iterator of lines and yields (tags, line) pairs
-ProcessorFn = Callable[[Iterator[str]], Iterator[Tuple[List[str], str]]]
+ProcessorFn = Callable[[Iterator[str]], Iterator[Tuple[Tuple[str, ...], str]]]
@@ -1,10 +1,13 @@
+import sys
+
+# Answer --version before importing typer and the pipeline stack
+if len(sys.argv) >= 2 and sys.argv[1] in ("-v", "--version"):
+    print("0.1.0")
+    sys.exit(0)
+
 import typer
 from typing_extensions import Annotated
-from dotenv import load_dotenv
 
-from main import run
-
-load_dotenv()
 app = typer.Typer(help="Run a DAG-based line processing pipeline.")
 
 @app.command()
@@ -23,6 +26,9 @@ def main(
     Run a DAG pipeline on input lines. Each processor can yield tagged lines, which
     are routed according to the DAG config.
     """
+    # Deferred so --help never imports the pipeline
+    from main import run
+
     run(input, config, output)
 
 if __name__ == "__main__":
@@ -1,15 +1,38 @@
+import os
 import yaml
+import functools
 import importlib
+from collections import deque
+from processors.base import streamify
 from typing import Any, Iterator, Callable, Iterable, Tuple
 
-# Each processor now yields list of tags + line
-ProcessorFn = Callable[[Iterator[str]], Iterator[Tuple[list[str], str]]]
+# Each processor now yields a tuple of tags + line
+ProcessorFn = Callable[[Iterator[str]], Iterator[Tuple[Tuple[str, ...], str]]]
 
-def load_function(import_path: str) -> ProcessorFn:
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+@functools.lru_cache(maxsize=32)
+def parse_config(config_path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+def read_config(config_path: str) -> dict[str, Any]:
+    """Parse a YAML config, reusing the cached parse while the file's mtime is unchanged."""
+    return parse_config(config_path, os.stat(config_path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=None)
+def resolve(import_path: str) -> Any:
     module_path, name = import_path.rsplit(".", 1)
     module = importlib.import_module(module_path)
-    obj = getattr(module, name)
+    return getattr(module, name)
 
+def load_function(import_path: str) -> ProcessorFn:
+    obj = resolve(import_path)
+
+    # Instantiate outside the cache so each build gets fresh processor state
     if isinstance(obj, type):
         obj = obj()
     if not callable(obj):
@@ -23,10 +46,13 @@ class DAGNode:
         self.processor = processor
         self.routes = routes  # tag -> downstream node name
         self.output_nodes: list[DAGNode] = []
+        # tag -> downstream node, resolved once; None when the target doesn't exist
+        self.next_by_tag: dict[str, DAGNode | None] = {}
+        # Start node fuse_streamified reshaped the graph around, if it fused anything
+        self.fusion_root: DAGNode | None = None
 
 def build_dag(config_path: str) -> dict[str, DAGNode]:
-    with open(config_path, "r") as f:
-        config: dict[str, Any] = yaml.safe_load(f)
+    config = read_config(config_path)
 
     nodes: dict[str, DAGNode] = {}
     for node_cfg in config.get("nodes", []):
@@ -38,26 +64,120 @@ def build_dag(config_path: str) -> dict[str, DAGNode]:
     # Connect nodes
     for node in nodes.values():
         node.output_nodes = [nodes[tgt] for tgt in node.routes.values() if tgt in nodes]
+        node.next_by_tag = {tag: nodes.get(tgt) for tag, tgt in node.routes.items()}
 
+    # run() always starts at the first node; level 6 has no `start` key
+    fuse_streamified(nodes, next(iter(nodes), None))
     return nodes
 
+def compose(first: Callable[[str], str], second: Callable[[str], str]) -> Callable[[str], str]:
+    def fused(line: str) -> str:
+        return second(first(line))
+    return fused
+
+def fuse_streamified(nodes: dict[str, DAGNode], start: str | None) -> None:
+    """
+    Collapse chains of streamify-wrapped nodes into one str->str call per line.
+    A streamified node only ever emits its own tag, so when that tag routes to
+    another streamified node the two can run as a single stage. Skipped nodes
+    stay in `nodes` so anything else routing to them is unaffected.
+
+    Fusing drops a hop, so the chain's lines would overtake lines that reach the
+    same place by a longer route. A chain is only extended into `nxt` when no
+    such place exists: everything from `nxt` down is fed by the chain alone, and
+    nothing outside it can yield output lines of its own.
+    """
+    if start not in nodes:
+        return
+
+    # Snapshot the graph before any node's routes are rewritten
+    successors = {
+        node: {n for n in node.next_by_tag.values() if n is not None}
+        for node in nodes.values()
+    }
+
+    def downstream(root: DAGNode) -> set[DAGNode]:
+        stack, seen = [root], set()
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(successors[node])
+        return seen
+
+    # Predecessor count per node; the start node is also fed the input lines
+    in_degree = dict.fromkeys(nodes.values(), 0)
+    in_degree[nodes[start]] += 1
+    for targets in successors.values():
+        for nxt in targets:
+            in_degree[nxt] += 1
+
+    def may_yield(node: DAGNode) -> bool:
+        # Judged from the fixed tags a processor emits; unknown means maybe
+        proc = node.processor
+        tags = (proc.tag,) if getattr(proc, "inner_fn", None) else getattr(proc, "tags", None)
+        return tags is None or any(tag not in node.next_by_tag for tag in tags)
+
+    yielding = {node for node in downstream(nodes[start]) if may_yield(node)}
+
+    fused = False
+    for node in nodes.values():
+        seen = {node}
+        while True:
+            fn = getattr(node.processor, "inner_fn", None)
+            if fn is None:
+                break
+            nxt = node.next_by_tag.get(node.processor.tag)
+            nxt_fn = getattr(nxt.processor, "inner_fn", None) if nxt is not None else None
+            if nxt_fn is None or nxt in seen:
+                break
+            below = downstream(nxt)
+            if any(in_degree[n] != 1 for n in below) or not yielding <= below:
+                break
+            seen.add(nxt)
+            node.processor = streamify(compose(fn, nxt_fn), tag=nxt.processor.tag)
+            node.routes = nxt.routes
+            node.output_nodes = nxt.output_nodes
+            node.next_by_tag = nxt.next_by_tag
+            fused = True
+
+    if fused:
+        for node in nodes.values():
+            node.fusion_root = nodes[start]
+
 def run_dag(start_node: DAGNode, lines: Iterable[str]) -> Iterator[str]:
-    # Each element: (tags, line)
-    pending: list[Tuple[list[str], str, DAGNode]] = [( ["default"], line, start_node) for line in lines ]
+    # Fusion is only order-preserving for the start node it was checked against
+    root = start_node.fusion_root
+    if root is not None and root is not start_node:
+        raise ValueError(f"DAG was fused for start node '{root.name}', not '{start_node.name}'")
+
+    # Each element: (node, batch of lines waiting for that node). Every batch goes
+    # through its processor in one call instead of one iter([line]) per line.
+    pending: deque[Tuple[DAGNode, list[str]]] = deque([(start_node, list(lines))])
 
     while pending:
-        tags, line, node = pending.pop(0)
-        for out_tags, out_line in node.processor(iter([line])):
-            # Fan-out by tags
-            next_nodes = set()
-            for tag in out_tags:
-                if tag in node.routes:
-                    next_nodes.add(node.routes[tag])
+        node, batch = pending.popleft()
+        next_by_tag = node.next_by_tag
+
+        # Streamified processors are a plain str->str call with one fixed tag, so
+        # skip the generator and route the whole mapped batch in one go
+        fn = getattr(node.processor, "inner_fn", None)
+        if fn is not None:
+            tag = node.processor.tag
+            if tag not in next_by_tag:
+                yield from map(fn, batch)
+            elif next_by_tag[tag] is not None:
+                pending.append((next_by_tag[tag], list(map(fn, batch))))
+            continue
+
+        outgoing: dict[DAGNode, list[str]] = {}
+        for out_tags, out_line in node.processor(iter(batch)):
+            next_nodes = {next_by_tag[tag] for tag in out_tags if tag in next_by_tag}
             if next_nodes:
-                for next_node_name in next_nodes:
-                    next_node = next((n for n in node.output_nodes if n.name == next_node_name), None)
-                    if next_node:
-                        pending.append((["default"], out_line, next_node))
+                for next_node in next_nodes:
+                    if next_node is not None:
+                        outgoing.setdefault(next_node, []).append(out_line)
             else:
                 # No route, yield as final output
                 yield out_line
+        pending.extend(outgoing.items())
@@ -1,14 +1,17 @@
+from operator import add
+
 def generate_pascals_triangle(n):
     triangle = []
 
     for i in range(n):
-        # Start each row with 1
-        row = [1] * (i + 1)
-        
-        # Compute the inner elements
-        for j in range(1, i):
-            row[j] = triangle[i-1][j-1] + triangle[i-1][j]
-        
+        if i == 0:
+            row = [1]
+        else:
+            # Each inner element is the sum of the two above it; add the
+            # previous row to itself shifted by one instead of indexing per cell
+            prev = triangle[-1]
+            row = [1, *map(add, prev, prev[1:]), 1]
+
         triangle.append(row)
 
     return triangle
@@ -27,25 +27,35 @@ def ensure_table(conn):
     conn.commit()
     cursor.close()
 
-def insert_employee(conn):
-    """Insert a new employee row."""
+def insert_employee(conn, n=1):
+    """
+    Insert n new employee rows in one batch and a single commit.
+    Returns the id MySQL assigned to the first inserted row (LAST_INSERT_ID()).
+    """
     names = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank"]
-    name = random.choice(names)
-    uid = str(uuid.uuid4())
-    time_of_entry = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # mysql-connector accepts datetime directly, no strftime round-trip needed
+    rows = [
+        (random.choice(names), str(uuid.uuid4()), datetime.now().replace(microsecond=0))
+        for _ in range(n)
+    ]
 
     cursor = conn.cursor()
-    cursor.execute(
+    cursor.executemany(
         "INSERT INTO employees (name, uid, time_of_entry) VALUES (%s, %s, %s)",
-        (name, uid, time_of_entry),
+        rows,
     )
     conn.commit()
+    last_id = cursor.lastrowid
     cursor.close()
+    return last_id
 
-def get_last_employee(conn):
-    """Fetch the last inserted employee row."""
+def get_last_employee(conn, employee_no):
+    """Fetch the employee row we just inserted by its primary key."""
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM employees ORDER BY no DESC LIMIT 1")
+    cursor.execute(
+        "SELECT no, name, uid, time_of_entry FROM employees WHERE no = %s",
+        (employee_no,),
+    )
     row = cursor.fetchone()
     cursor.close()
     return row
@@ -59,8 +69,8 @@ def main():
     conn = mysql.connector.connect(**DB_CONFIG)
 
     ensure_table(conn)
-    insert_employee(conn)
-    row = get_last_employee(conn)
+    last_id = insert_employee(conn)
+    row = get_last_employee(conn, last_id)
     if row:
         write_to_file(row)
 